@@ -1,8 +1,18 @@
 import json
+from contextlib import closing
 from datetime import datetime
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import AIMessage
 import re
 
+from utils.logging_utils import append_jsonl
+
+# Generation is cut server-side if the model starts writing the next conversation turn itself
+_STOP_SEQUENCES = ["\nUser:", "\nAssistant:"]
+# Parses "TOOL: <name> QUERY: <query>" out of the model's decision
+_TOOL_RE = re.compile(r"TOOL:\s*(\w+)\s*QUERY:\s*(.*)", re.DOTALL)
+# A tool call is complete once its QUERY line has been terminated
+_TOOL_CALL_COMPLETE_RE = re.compile(r"TOOL:\s*\w+\s*QUERY:[^\n]*\S[^\n]*\n")
+
 class CommunicationAgent:
     """
     A stateful coordinator agent that maintains conversation history to handle
@@ -12,37 +22,59 @@ class CommunicationAgent:
         self.llm = llm
         self.tools = tools
         self.memory = memory # Though unused, kept for structural consistency
-        self.reflection_message = ""
-        # The log_history will now serve as our primary conversation memory
+        # Reflection notes are kept as a list and only joined when read (see reflection_message)
+        self._reflection_parts: list[str] = []
+        # The log_history will now serve as our primary conversation memory,
+        # stored as plain {"role", "content"} dicts that are directly serializable
         self.log_history = []
+        # Pre-rendered "User: ..."/"Assistant: ..." lines, appended as messages are logged
+        self._history_parts: list[str] = []
+        # Index of the first log entry not yet written to the session log
+        self._saved_log_index = 0
         self.max_turns = max_turns
+        # The tool descriptions and instructions never change, so both are rendered exactly once
+        self._tools_block = "\n".join(f"- `{name}`: {(tool.__class__.__doc__ or 'No description available').strip()}" for name, tool in tools.items())
+        self._system_prefix = self._build_system_prefix()
+
+    @property
+    def reflection_message(self):
+        return "".join(self._reflection_parts)
 
     def log(self, role, content):
         """Logs a message to the conversation history."""
-        # We now store LangChain message objects for better structure
         if role == "user":
-            self.log_history.append(HumanMessage(content=content))
+            self.log_history.append({"role": "user", "content": content})
+            self._history_parts.append(f"User: {content}")
         else:
-            # For system/agent messages, we can use AIMessage or a custom format
-            self.log_history.append(AIMessage(content=content))
-
-    def _save_log_to_file(self, original_query):
-        """Saves the structured log to a file."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"logs/ca_session_{timestamp}.json"
-        
-        # Convert message objects to a serializable format
-        serializable_log = [
-            {"role": "user" if isinstance(msg, HumanMessage) else "assistant", "content": msg.content}
-            for msg in self.log_history
-        ]
-
-        with open(filename, "w") as f:
-            json.dump({
-                "initial_user_query": original_query,
-                "log": serializable_log,
-                "final_reflection": self.reflection_message
-            }, f, indent=2)
+            # System/agent messages are all recorded as assistant turns
+            self.log_history.append({"role": "assistant", "content": content})
+            self._history_parts.append(f"Assistant: {content}")
+
+    def _save_log_to_file(self, user_query):
+        """Appends the messages logged since the last save to the session log as one JSONL record."""
+        new_messages = self.log_history[self._saved_log_index:]
+        self._saved_log_index = len(self.log_history)
+
+        append_jsonl("logs/ca_sessions.jsonl", {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "user_query": user_query,
+            "log": new_messages,
+            "final_reflection": self.reflection_message
+        })
+
+    def _generate(self, prompt):
+        """
+        Streams the model's decision, stopping as soon as a complete tool call has been emitted.
+        Final answers are streamed to the end, since the whole answer is needed.
+        """
+        output = ""
+        with closing(self.llm.stream(prompt, stop=_STOP_SEQUENCES)) as chunks:
+            for chunk in chunks:
+                # Chat models stream message chunks, plain LLMs (e.g. Ollama) stream strings
+                output += getattr(chunk, "content", chunk)
+                if "ANSWER:" not in output and _TOOL_CALL_COMPLETE_RE.search(output):
+                    break
+        return output.strip()
 
     def handle_user_query(self, query):
         # Add the user's new message to the conversation history
@@ -51,22 +83,21 @@ class CommunicationAgent:
         # The agent loop now runs for a few turns to decide on an action
         for i in range(self.max_turns):
             # The prompt now receives the entire conversation history
-            prompt = self._build_prompt(self.log_history)
+            prompt = self._build_prompt()
             
-            model_response_object = self.llm.invoke(prompt)
-            model_output = model_response_object.content.strip()
+            model_output = self._generate(prompt)
             
             self.log("assistant", f"[Thought]: {model_output}") # Log the thought process
 
             if "ANSWER:" in model_output:
                 final_answer = model_output.split("ANSWER:", 1)[1].strip()
                 self.log("assistant", f"[Final Answer]: {final_answer}")
-                self._save_log_to_file(self.log_history[0].content)
+                self._save_log_to_file(query)
                 # Return only the answer and the full log
                 return final_answer, self.log_history
 
             try:
-                tool_match = re.search(r"TOOL:\s*(\w+)\s*QUERY:\s*(.*)", model_output, re.DOTALL)
+                tool_match = _TOOL_RE.search(model_output) if "TOOL:" in model_output else None
                 if not tool_match:
                     raise ValueError("Output does not match ANSWER: or TOOL: ... QUERY: ... format")
 
@@ -94,16 +125,19 @@ class CommunicationAgent:
         
         final_answer = "I'm sorry, but I seem to be stuck. Could you please try rephrasing your request?"
         self.log("assistant", f"[Final Answer]: {final_answer}")
-        self._save_log_to_file(self.log_history[0].content)
+        self._save_log_to_file(query)
         return final_answer, self.log_history
 
-    def _build_prompt(self, conversation_history):
-        available_tools = "\n".join([f"- `{name}`: {(tool.__class__.__doc__ or 'No description available').strip()}" for name, tool in self.tools.items()])
+    def _build_prompt(self):
+        # Each history line was already rendered when it was logged, so this is a single join
+        history_str = "\n".join(self._history_parts)
 
-        # Convert conversation history to a readable string format
-        history_str = "\n".join([f"{'User' if isinstance(msg, HumanMessage) else 'Assistant'}: {msg.content}" for msg in conversation_history])
+        # The invariant instructions and tool list come first, byte-identical on every turn, so the
+        # LLM server can reuse its cached prefix; only the conversation history changes between turns.
+        return self._system_prefix + history_str + self._prompt_suffix
 
-        prompt = f"""You are a helpful assistant for **NexaCorp**. Your goal is to answer employee queries by using the correct tool based on the **entire conversation history**.
+    def _build_system_prefix(self):
+        return f"""You are a helpful assistant for **NexaCorp**. Your goal is to answer employee queries by using the correct tool based on the **entire conversation history**.
 
         **Your Thought Process:**
         1.  **Analyze the full Conversation History:** Understand the user's intent and any information they've provided in previous turns.
@@ -114,11 +148,13 @@ class CommunicationAgent:
         3.  **Handle Failures:** If a tool fails, ask the user for clarification.
 
         **Available Tools:**
-        {available_tools}
+        {self._tools_block}
 
         **Conversation History:**
         ---
-        {history_str}
+        """
+
+    _prompt_suffix = """
         ---
 
         **Your Next Step:**
@@ -127,5 +163,3 @@ class CommunicationAgent:
         - If you need to use a tool, respond with `TOOL: <tool_name> QUERY: <query for the tool>`.
 
         Your decision:"""
-        return prompt
-
@@ -1,5 +1,7 @@
 import re
-from langchain_core.messages import AIMessage, HumanMessage
+
+_SCORE_RE = re.compile(r"Score:\s*([0-9.]+)")
+_JUDGMENT_RE = re.compile(r"Judgment:\s*(.*)", re.DOTALL)
 
 class JudgeAgent:
     """
@@ -12,14 +14,9 @@ class JudgeAgent:
     def evaluate(self, conversation_log):
         """
         Evaluates a conversation log using the provided LLM.
+        The log is a list of {"role", "content"} dicts, as kept by CommunicationAgent.
         """
-        # Ensure the log is in a format the LLM can process
-        serializable_log = [
-            {"role": "user" if isinstance(msg, HumanMessage) else "assistant", "content": msg.content}
-            for msg in conversation_log
-        ]
-        
-        prompt = self._build_prompt(serializable_log)
+        prompt = self._build_prompt(conversation_log)
         
         try:
             # The ChatGroq model returns an AIMessage object
@@ -27,8 +24,8 @@ class JudgeAgent:
             content = response_object.content.strip()
 
             # Use regex to robustly parse the score and judgment
-            score_match = re.search(r"Score:\s*([0-9.]+)", content)
-            judgment_match = re.search(r"Judgment:\s*(.*)", content, re.DOTALL)
+            score_match = _SCORE_RE.search(content)
+            judgment_match = _JUDGMENT_RE.search(content)
 
             if not score_match or not judgment_match:
                 # If parsing fails, return a specific error
@@ -1,56 +1,31 @@
-from langchain_core.messages import HumanMessage, AIMessage
-from communication_agent import CommunicationAgent
-from retrieval_agent import RetrievalAgent
-from langchain_chroma import Chroma
-from langchain_huggingface.embeddings import HuggingFaceEmbeddings
-from langchain_ollama import OllamaLLM
-from datetime import datetime
-import json
+import sys
 import os
 
-# Create logs directory if not exists
-os.makedirs("logs", exist_ok=True)
+# Add project root to the Python path to find the shared utils
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-# Load Ollama LLM
-llm = OllamaLLM(model="llama3")
-
-# Load vector stores
-embedding = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
-vectorstores = {
-    "hr": Chroma(persist_directory="chroma/hr", embedding_function=embedding).as_retriever(),
-    "it": Chroma(persist_directory="chroma/it", embedding_function=embedding).as_retriever(),
-    "payroll": Chroma(persist_directory="chroma/payroll", embedding_function=embedding).as_retriever(),
-    "tickets": Chroma(persist_directory="chroma/tickets", embedding_function=embedding).as_retriever(),
-}
+from agents.communication_agent import CommunicationAgent
+from agents.retrieval_agent import RetrievalAgent
+from utils.vector_store_registry import get_embeddings, get_retriever
+from langchain_ollama import OllamaLLM
+from datetime import datetime
+import json
 
-# Initialize agents
-ra = RetrievalAgent(llm=llm, retrievers=vectorstores, memory=None, top_k_rerank=5)
-ca = CommunicationAgent(llm=llm, tools={"retrieval_agent": ra}, memory=None)
+def build_agents(llm, retrievers, query_embedding=None):
+    """Creates the RA over the given domain retrievers and the CA that uses it as its retrieval tool."""
+    ra = RetrievalAgent(llm=llm, retrievers=retrievers, memory=None, top_k_rerank=5, query_embedding=query_embedding)
+    ca = CommunicationAgent(llm=llm, tools={"retrieval_agent": ra}, memory=None)
+    return ca, ra
 
-def run_multi_agent_conversation(user_query: str, max_turns=3):
+def run_multi_agent_conversation(user_query: str, ca: CommunicationAgent, ra: RetrievalAgent):
     print(f"\n=== User Query ===\n{user_query}\n")
 
-    # Step 1: CA handles the initial query
-    answer, ra_requests = ca.handle_user_query(user_query)
-
-    for turn in range(max_turns):
-        if not ra_requests:
-            break
-
-        # Step 2: RA processes each CA internal message
-        ra_responses = []
-        for msg in ra_requests:
-            response = ra.process_request(msg)
-            ra_responses.append(response)
-
-        # Step 3: CA handles the responses
-        answer, ra_requests = ca.handle_ra_response(ra_responses)
-
-        if answer:
-            break
+    # The CA runs its own decision loop and sends every retrieval_agent tool call to the RA
+    answer, _ = ca.handle_user_query(user_query)
 
     print(f"\n=== Final Answer ===\n{answer}\n")
     save_interaction(user_query, ca, ra, answer)
+    return answer
 
 def save_interaction(user_query, ca, ra, final_answer):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -66,8 +41,19 @@ def save_interaction(user_query, ca, ra, final_answer):
         }, f, indent=2)
     print(f"[SUCCESS] Interaction saved to {filename}")
 
+def main():
+    # Create logs directory if not exists
+    os.makedirs("logs", exist_ok=True)
+
+    # Load Ollama LLM
+    llm = OllamaLLM(model="llama3")
+
+    # Load vector stores
+    vectorstores = {domain: get_retriever(f"chroma/{domain}") for domain in ("hr", "it", "payroll", "tickets")}
+
+    # Initialize agents
+    ca, ra = build_agents(llm, vectorstores, query_embedding=get_embeddings())
 
-if __name__ == "__main__":
     # You can change the test queries here
     user_queries = [
         "How do I apply for sick leave?",
@@ -77,4 +63,8 @@ if __name__ == "__main__":
     ]
 
     for query in user_queries:
-        run_multi_agent_conversation(query)
+        run_multi_agent_conversation(query, ca, ra)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,4 @@
 import json
-from langchain_core.messages import AIMessage, HumanMessage
 
 class OptimizerAgent:
     """
@@ -12,14 +11,9 @@ class OptimizerAgent:
     def suggest_improvement(self, conversation_log, judge_score, judge_judgment, original_prompt):
         """
         Takes a failed conversation and suggests a new, improved prompt.
+        The log is a list of {"role", "content"} dicts, as kept by CommunicationAgent.
         """
-        # Ensure the log is in a readable format
-        serializable_log = [
-            {"role": "user" if isinstance(msg, HumanMessage) else "assistant", "content": msg.content}
-            for msg in conversation_log
-        ]
-        
-        prompt = self._build_prompt(serializable_log, judge_score, judge_judgment, original_prompt)
+        prompt = self._build_prompt(conversation_log, judge_score, judge_judgment, original_prompt)
         
         try:
             response_object = self.model.invoke(prompt)
@@ -1,13 +1,46 @@
-import json
+import asyncio
+import os
+import re
+import threading
+from concurrent.futures import as_completed
 from datetime import datetime
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+from cachetools import TTLCache
+from langchain_core.embeddings import Embeddings
 from langchain_core.messages import AIMessage
 from langchain_core.documents import Document
 from langchain_core.vectorstores import VectorStoreRetriever
 # Import the dedicated re-ranking library
 from flashrank import Ranker, RerankRequest
 
+from utils.logging_utils import append_jsonl
+from utils.pool import EXECUTOR
+
+# Words dropped when canonicalizing a query for the response cache. Only articles, pronouns and
+# "please" are dropped; question words and modals change the meaning ("when" vs "where", "can" vs "should").
+_STOPWORDS = frozenset({
+    "a", "an", "the", "i", "my", "me", "we", "our", "you", "your", "it", "this", "that", "please",
+})
+
+def _canonicalize_query(query: str) -> str:
+    """Lowercases the query, drops punctuation and stopwords, and collapses whitespace."""
+    words = [word for word in re.findall(r"\w+", query.lower()) if word not in _STOPWORDS]
+    return " ".join(words) or query.strip().lower()
+
+# Re-ranker model configuration. flashrank ships ms-marco-MiniLM-L-12-v2 as an INT8-quantized
+# ONNX model (flashrank-MiniLM-L-12-v2_Q.onnx), so it already runs int8 on CPU. Set RERANK_MODEL to
+# "ms-marco-TinyBERT-L-2-v2" for a smaller, faster (and less accurate) model.
+RERANK_MODEL = os.getenv("RERANK_MODEL", "ms-marco-MiniLM-L-12-v2")
+RERANK_CACHE_DIR = os.getenv("RERANK_CACHE_DIR", "/opt/flashrank-cache")
+
+@lru_cache(maxsize=1)
+def _get_reranker() -> Ranker:
+    """Loads the flashrank model once per process and shares it between RetrievalAgent instances."""
+    return Ranker(model_name=RERANK_MODEL, cache_dir=RERANK_CACHE_DIR)
+
 class RetrievalAgent:
     """
     Retrieves documents using a fetch-and-rerank strategy for higher accuracy.
@@ -15,81 +48,288 @@ class RetrievalAgent:
     model to find the most relevant documents before passing them to the LLM.
     """
 
-    def __init__(self, llm, retrievers: Dict[str, VectorStoreRetriever], memory, top_k_rerank: int = 5):
+    def __init__(self, llm, retrievers: Dict[str, VectorStoreRetriever], memory, top_k_rerank: int = 5, max_rerank_candidates: int = 40,
+                 query_embedding: Optional[Embeddings] = None, cache_ttl: int = 3600, cache_similarity: float = 0.95,
+                 rerank_threshold: float = 0.15, verbose: bool = False, fetch_k: int = 25):
         self.llm = llm
         self.retrievers = retrievers
+        # Iterated on every request, so the (domain, retriever) pairs are fixed once here
+        self._retriever_items = tuple(retrievers.items())
+        # When verbose, the full text of every retrieved document is written to logs/ra_documents.jsonl
+        self.verbose = verbose
+        # Number of documents fetched from each domain, to give the re-ranker more to work with.
+        # It is passed to every search, whatever k the retrievers were built with.
+        self.fetch_k = fetch_k
         self.memory = memory
-        self.reflection_message = ""
+        # Reflection notes accumulate over the agent's lifetime, so they are kept as a list
+        # and only joined when read (see reflection_message)
+        self._reflection_parts: List[str] = []
         self.log_history = []
+        # Index of the first log entry not yet written to the session log
+        self._saved_log_index = 0
+        # Requests can run in worker threads at the same time (see aprocess_requests), so each one
+        # collects its log entries locally and they are added to the shared log under this lock
+        self._log_lock = threading.Lock()
+        # The HuggingFace fast tokenizer behind an embedding model can't be used from two threads at once
+        # ("Already borrowed"), so query embedding is serialized; it is a single short forward pass
+        self._embed_lock = threading.Lock()
         # The number of top documents to keep after re-ranking
         self.top_k_rerank = top_k_rerank
-        # Initialize the re-ranker. ms-marco-MiniLM-L-12-v2 is a good, lightweight model.
+        # The cross-encoder only sees the closest candidates by vector distance, not the whole fetch
+        self.max_rerank_candidates = max_rerank_candidates
+        # Re-ranking is skipped when the closest document is already within this vector distance
+        self.rerank_threshold = rerank_threshold
+        # Initialize the re-ranker (loaded once and reused by every agent instance).
         try:
-            self.reranker = Ranker(model_name="ms-marco-MiniLM-L-12-v2", cache_dir="/opt/flashrank-cache")
+            self.reranker = _get_reranker()
         except Exception as e:
             print(f"Warning: Could not initialize flashrank Ranker. Re-ranking will be skipped. Error: {e}")
             self.reranker = None
+        # Successful answers are cached by canonical query. If an embedding model is given, a new query
+        # whose embedding is close enough (cosine >= cache_similarity) to a cached one reuses its answer too.
+        self._response_cache = TTLCache(maxsize=1024, ttl=cache_ttl)
+        self._query_embedding = query_embedding
+        self._cache_similarity = cache_similarity
+        self._cached_query_keys: List[str] = []
+        self._cached_query_vectors: List[np.ndarray] = []
 
 
-    def log(self, role, content):
-        self.log_history.append({"role": role, "content": content})
+    def log(self, role, content, entries: Optional[List[dict]] = None):
+        """Adds an entry to the request-local `entries` list if given, otherwise to the shared log."""
+        entry = {"role": role, "content": content}
+        if entries is not None:
+            entries.append(entry)
+            return
+        with self._log_lock:
+            self.log_history.append(entry)
 
-    def _save_log(self):
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"logs/ra_session_{timestamp}.json"
-        with open(filename, "w") as f:
-            json.dump({
-                "log": self.log_history,
-                "reflection": self.reflection_message
-            }, f, indent=2)
+    def _save_log(self, entries: List[dict], success: bool):
+        """
+        Adds one request's entries to the shared log, updates the reflection and appends everything
+        logged since the last save as one JSONL record, so concurrent requests never interleave.
+        Each record carries only this request's reflection note, not the agent's whole reflection.
+        """
+        with self._log_lock:
+            self.log_history.extend(entries)
+            new_entries = self.log_history[self._saved_log_index:]
+            self._saved_log_index = len(self.log_history)
+            self.update_reflection(success)
+            append_jsonl("logs/ra_sessions.jsonl", {
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "log": new_entries,
+                "reflection": self._reflection_parts[-1].strip()
+            })
+
+    @property
+    def reflection_message(self) -> str:
+        return "".join(self._reflection_parts)
 
     def update_reflection(self, success):
         if success:
-            self.reflection_message += " Found relevant documents via re-ranking."
+            self._reflection_parts.append(" Found relevant documents via re-ranking.")
         else:
-            self.reflection_message += " Could not find useful documents even after re-ranking."
+            self._reflection_parts.append(" Could not find useful documents even after re-ranking.")
+
+    def _embed_query(self, embeddings: Embeddings, query: str) -> List[float]:
+        with self._embed_lock:
+            return embeddings.embed_query(query)
+
+    @staticmethod
+    def _unit(vector: List[float]) -> np.ndarray:
+        unit = np.asarray(vector, dtype=np.float32)
+        return unit / (np.linalg.norm(unit) or 1.0)
+
+    def _search_with_scores(self, retriever: VectorStoreRetriever, query: str, query_vector: Optional[List[float]]) -> List[Tuple[Document, float]]:
+        """
+        Runs the retriever's search against its vector store for fetch_k documents, keeping the distance scores.
+        Given the query's embedding, the store looks that vector up instead of embedding the query again.
+        """
+        vectorstore = retriever.vectorstore
+        search_kwargs = {**retriever.search_kwargs, "k": self.fetch_k}
+        if query_vector is None:
+            return vectorstore.similarity_search_with_score(query, **search_kwargs)
+        if hasattr(vectorstore, "similarity_search_with_score_by_vector"):
+            # FAISS
+            return vectorstore.similarity_search_with_score_by_vector(query_vector, **search_kwargs)
+        # Chroma (despite the name, it returns distances, like similarity_search_with_score)
+        return vectorstore.similarity_search_by_vector_with_relevance_scores(query_vector, **search_kwargs)
+
+    def _lookup_cached_response(self, query: str) -> Tuple[str, Optional[List[float]], Optional[AIMessage]]:
+        """
+        Returns (cache_key, query_vector, cached_response); cached_response is None on a miss. On a miss
+        the query's embedding is returned as well, so retrieval can reuse it instead of embedding again.
+        """
+        key = _canonicalize_query(query)
+        cached = self._response_cache.get(key)
+        if cached is not None or self._query_embedding is None:
+            return key, None, cached
+
+        vector = self._embed_query(self._query_embedding, query)
+        if self._cached_query_vectors:
+            similarities = np.dot(np.vstack(self._cached_query_vectors), self._unit(vector))
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self._cache_similarity:
+                cached = self._response_cache.get(self._cached_query_keys[best])
+        return key, vector, cached
+
+    def _store_cached_response(self, key: str, vector: Optional[List[float]], response: AIMessage):
+        if response.content.startswith("NO_INFO_FOUND"):
+            return
+        self._response_cache[key] = response
+        if vector is not None:
+            # Forget vectors whose answers have expired from the TTL cache before adding the new one
+            live = [i for i, cached_key in enumerate(self._cached_query_keys) if cached_key in self._response_cache]
+            self._cached_query_keys = [self._cached_query_keys[i] for i in live] + [key]
+            self._cached_query_vectors = [self._cached_query_vectors[i] for i in live] + [self._unit(vector)]
 
     def process_request(self, query: str) -> AIMessage:
-        self.log("ca_message", query)
-        self.log("ra_thought", f"Step 1: Fetching initial documents for query: '{query}'")
+        key, vector, cached = self._lookup_cached_response(query)
+        if cached is not None:
+            self.log("cache_hit", query)
+            return cached
+
+        entries = []
+        summary_prompt, failure = self._prepare_summary_prompt(query, entries, vector)
+        if failure is not None:
+            return failure
+        response = self._finish_summary(self.llm.invoke(summary_prompt), entries)
+        self._store_cached_response(key, vector, response)
+        return response
+
+    async def aprocess_request(self, query: str) -> AIMessage:
+        """
+        Async variant of process_request. Retrieval and re-ranking run in a worker thread
+        and the summary is awaited with llm.ainvoke, so several requests can be gathered
+        concurrently instead of paying one LLM round-trip after another.
+        """
+        key, vector, cached = await asyncio.to_thread(self._lookup_cached_response, query)
+        if cached is not None:
+            self.log("cache_hit", query)
+            return cached
+
+        entries = []
+        summary_prompt, failure = await asyncio.to_thread(self._prepare_summary_prompt, query, entries, vector)
+        if failure is not None:
+            return failure
+        response = self._finish_summary(await self.llm.ainvoke(summary_prompt), entries)
+        self._store_cached_response(key, vector, response)
+        return response
+
+    async def aprocess_requests(self, queries: List[str], max_concurrency: int = 8) -> List[AIMessage]:
+        """
+        Processes several independent requests at once. Retrieval for all queries runs concurrently,
+        and every summary that is still needed goes to the LLM in a single llm.abatch call.
+        Responses are returned in the same order as the queries.
+        """
+        lookups = await asyncio.gather(*(asyncio.to_thread(self._lookup_cached_response, query) for query in queries))
+        responses: List[Optional[AIMessage]] = []
+        for query, (_, _, cached) in zip(queries, lookups):
+            if cached is not None:
+                self.log("cache_hit", query)
+            responses.append(cached)
+
+        pending = [i for i, response in enumerate(responses) if response is None]
+        entries = {i: [] for i in pending}
+        prepared = await asyncio.gather(*(asyncio.to_thread(self._prepare_summary_prompt, queries[i], entries[i], lookups[i][1])
+                                          for i in pending))
+        to_summarize = []
+        for i, (summary_prompt, failure) in zip(pending, prepared):
+            if failure is not None:
+                responses[i] = failure
+            else:
+                to_summarize.append((i, summary_prompt))
+
+        if to_summarize:
+            outputs = await self.llm.abatch([summary_prompt for _, summary_prompt in to_summarize],
+                                            config={"max_concurrency": max_concurrency})
+            for (i, _), output in zip(to_summarize, outputs):
+                key, vector, _ = lookups[i]
+                responses[i] = self._finish_summary(output, entries[i])
+                self._store_cached_response(key, vector, responses[i])
+        return responses
+
+    def _prepare_summary_prompt(self, query: str, entries: List[dict],
+                                query_vector: Optional[List[float]] = None) -> Tuple[Optional[str], Optional[AIMessage]]:
+        """
+        Runs fetch-and-rerank and returns (summary_prompt, None), or (None, failure_message) if nothing was found.
+        Log entries for this request are collected in `entries` until the request's log is saved.
+        query_vector is the query's embedding under query_embedding, if it has already been computed.
+        """
+        self.log("ca_message", query, entries)
+        self.log("ra_thought", f"Step 1: Fetching initial documents for query: '{query}'", entries)
 
         # Step 1: Fetch a larger set of initial documents from all retrievers.
-        all_docs: List[Document] = []
-        for domain, retriever in self.retrievers.items():
+        # Each similarity search is independent and IO-bound, so the domains are queried concurrently.
+        # Documents are de-duplicated as they arrive, keeping the vector distance Chroma returned for each.
+        # The query is embedded once per embedding model (normally one shared by every domain), here
+        # rather than in each search, and the searches only look that vector up.
+        scored_docs: List[Tuple[float, Document]] = []
+        seen = set()
+        query_vectors = {}
+        if query_vector is not None and self._query_embedding is not None:
+            query_vectors[id(self._query_embedding)] = query_vector
+        futures = {}
+        for domain, retriever in self._retriever_items:
+            embeddings = retriever.vectorstore.embeddings
+            try:
+                if embeddings is not None and id(embeddings) not in query_vectors:
+                    query_vectors[id(embeddings)] = self._embed_query(embeddings, query)
+            except Exception as e:
+                self.log("error", f"Error retrieving from domain {domain}: {e}", entries)
+                continue
+            vector = query_vectors.get(id(embeddings)) if embeddings is not None else None
+            futures[EXECUTOR.submit(self._search_with_scores, retriever, query, vector)] = domain
+        for future in as_completed(futures):
+            domain = futures[future]
             try:
-                # Configure the retriever to fetch more documents (e.g., 25) to give the re-ranker more to work with.
-                retriever.search_kwargs = {'k': 25}
-                retrieved_docs = retriever.invoke(query)
-                if retrieved_docs:
-                    self.log(f"retrieved_{len(retrieved_docs)}_docs_from_{domain}", [doc.page_content for doc in retrieved_docs])
-                    all_docs.extend(retrieved_docs)
+                retrieved = future.result()
+                if retrieved:
+                    # Only the count is kept in memory; full document text is logged to disk when verbose
+                    self.log(f"retrieved_docs_from_{domain}", len(retrieved), entries)
+                    if self.verbose:
+                        append_jsonl("logs/ra_documents.jsonl", {
+                            "query": query,
+                            "domain": domain,
+                            "documents": [doc.page_content for doc, _ in retrieved]
+                        })
+                    for doc, score in retrieved:
+                        if doc.page_content not in seen:
+                            seen.add(doc.page_content)
+                            scored_docs.append((score, doc))
             except Exception as e:
-                self.log("error", f"Error retrieving from domain {domain}: {e}")
+                self.log("error", f"Error retrieving from domain {domain}: {e}", entries)
 
-        if not all_docs:
-            self.update_reflection(False)
-            self._save_log()
-            return AIMessage(content="NO_INFO_FOUND: No documents were found in the initial fetch.")
+        if not scored_docs:
+            self._save_log(entries, success=False)
+            return None, AIMessage(content="NO_INFO_FOUND: No documents were found in the initial fetch.")
 
-        unique_docs = list({doc.page_content: doc for doc in all_docs}.values())
-        self.log("initial_unique_docs_count", len(unique_docs))
+        self.log("initial_unique_docs_count", len(scored_docs), entries)
+
+        # Lower distance is closer; only the best candidates are handed to the (CPU-heavy) re-ranker.
+        scored_docs.sort(key=lambda item: item[0])
+        unique_docs = [doc for _, doc in scored_docs[:self.max_rerank_candidates]]
 
         # Step 2: Re-rank the retrieved documents to find the most relevant ones.
-        if self.reranker:
+        # The cross-encoder is the heaviest step here, so it only runs when the vector search alone
+        # isn't conclusive and there are more candidates than documents we keep.
+        best_distance = scored_docs[0][0]
+        if best_distance < self.rerank_threshold or len(unique_docs) <= self.top_k_rerank:
+            self.log("ra_thought", f"Skipping re-ranking (best distance {best_distance:.3f}, {len(unique_docs)} candidates).", entries)
+            top_docs_content = [doc.page_content for doc in unique_docs[:self.top_k_rerank]]
+        elif self.reranker:
             rerank_request = RerankRequest(query=query, passages=[{"text": doc.page_content} for doc in unique_docs])
             reranked_results = self.reranker.rerank(rerank_request)
             top_docs_content = [result['text'] for result in reranked_results[:self.top_k_rerank]]
-            self.log("reranked_top_docs_content", top_docs_content)
+            self.log("reranked_top_docs_content", top_docs_content, entries)
         else:
             # Fallback if re-ranker failed to initialize
-            self.log("warning", "Re-ranker not available, using top documents from initial fetch.")
+            self.log("warning", "Re-ranker not available, using top documents from initial fetch.", entries)
             top_docs_content = [doc.page_content for doc in unique_docs[:self.top_k_rerank]]
 
 
         if not top_docs_content:
-            self.update_reflection(False)
-            self._save_log()
-            return AIMessage(content="NO_INFO_FOUND: Re-ranking did not find any relevant documents.")
+            self._save_log(entries, success=False)
+            return None, AIMessage(content="NO_INFO_FOUND: Re-ranking did not find any relevant documents.")
 
         # Step 3: Use the LLM to synthesize an answer from ONLY the top-ranked documents.
         context = "\n\n---\n\n".join(top_docs_content)
@@ -105,16 +345,16 @@ class RetrievalAgent:
 
         If the documents contain the answer, extract it precisely. If they do not, respond with exactly "NO_INFO_FOUND".
         """
-        
-        summary_response = self.llm.invoke(summary_prompt)
-        summary = summary_response.content.strip()
+        return summary_prompt, None
+
+    def _finish_summary(self, summary_response, entries: List[dict]) -> AIMessage:
+        # Chat models (e.g. ChatGroq) return a message, plain LLMs (e.g. OllamaLLM) return a string
+        summary = getattr(summary_response, "content", summary_response).strip()
 
         if "no_info_found" in summary.lower():
-            self.update_reflection(False)
-            self._save_log()
+            self._save_log(entries, success=False)
             return AIMessage(content="NO_INFO_FOUND")
 
-        self.log("ra_summary", summary)
-        self.update_reflection(True)
-        self._save_log()
+        self.log("ra_summary", summary, entries)
+        self._save_log(entries, success=True)
         return AIMessage(content=summary)
@@ -11,10 +11,9 @@ from agents.retrieval_agent import RetrievalAgent
 # We will create the JudgeAgent in the next step, for now we can comment it out or create a placeholder
 # from agents.judge_agent import JudgeAgent 
 from tools.ticket_tool import TicketLookupTool
+from utils.vector_store_registry import get_embeddings, get_retriever
 
 from langchain_groq import ChatGroq
-from langchain_community.vectorstores import Chroma
-from langchain_community.embeddings import HuggingFaceEmbeddings
 
 # --- MOCK OBJECTS FOR UTILS (Placeholders) ---
 class ContextMemory:
@@ -46,16 +45,13 @@ def main():
         sys.exit(1)
 
     # --- Initialize Models and Tools ---
-    embedding_model = HuggingFaceEmbeddings(model_name=EMBED_MODEL)
     llm = ChatGroq(model_name="llama3-8b-8192", api_key=groq_api_key)
 
     # --- Load Vector Stores ---
     try:
         domain_retrievers = {
-            "hr": Chroma(persist_directory="data/chroma/hr", embedding_function=embedding_model).as_retriever(),
-            "it": Chroma(persist_directory="data/chroma/it", embedding_function=embedding_model).as_retriever(),
-            "payroll": Chroma(persist_directory="data/chroma/payroll", embedding_function=embedding_model).as_retriever(),
-            "tickets": Chroma(persist_directory="data/chroma/tickets", embedding_function=embedding_model).as_retriever(),
+            domain: get_retriever(f"data/chroma/{domain}", EMBED_MODEL)
+            for domain in ("hr", "it", "payroll", "tickets")
         }
     except Exception as e:
         print(f"FATAL ERROR: Could not load Chroma databases: {e}")
@@ -66,7 +62,8 @@ def main():
     ca_memory = ContextMemory()
     ra_memory = ContextMemory()
 
-    retrieval_agent = RetrievalAgent(llm=llm, retrievers=domain_retrievers, memory=ra_memory, top_k_rerank=5)
+    retrieval_agent = RetrievalAgent(llm=llm, retrievers=domain_retrievers, memory=ra_memory, top_k_rerank=5,
+                                     query_embedding=get_embeddings(EMBED_MODEL))
     ticket_tool = TicketLookupTool(csv_path="data/nexacorp_tickets.csv")
 
     tools = {
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Add project root to the Python path, as the entry-point scripts do
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
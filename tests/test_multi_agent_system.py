@@ -0,0 +1,54 @@
+import json
+
+from langchain_chroma import Chroma
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+import agents.retrieval_agent as retrieval_agent
+from agents.multi_agent_system import build_agents, run_multi_agent_conversation
+
+
+class ScriptedLLM:
+    """Plays the CA's decisions in order and answers every RA summary prompt with the same text."""
+
+    def __init__(self, decisions, summary):
+        self.decisions = list(decisions)
+        self.summary = summary
+        self.prompts = []
+
+    def stream(self, prompt, stop=None):
+        self.prompts.append(prompt)
+        yield self.decisions.pop(0)
+
+    def invoke(self, prompt):
+        self.prompts.append(prompt)
+        return self.summary
+
+
+def test_one_round(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "logs").mkdir()
+    # No re-ranker model is downloaded; with this few documents re-ranking is skipped anyway
+    monkeypatch.setattr(retrieval_agent, "_get_reranker", lambda: None)
+
+    embedding = DeterministicFakeEmbedding(size=16)
+    retrievers = {}
+    for domain, text in (("hr", "Sick leave is requested in the HR portal."), ("it", "Reset the VPN client.")):
+        store = Chroma(collection_name=f"{domain}_test", embedding_function=embedding)
+        store.add_texts([text])
+        retrievers[domain] = store.as_retriever()
+
+    llm = ScriptedLLM(
+        decisions=["TOOL: retrieval_agent QUERY: How do I apply for sick leave?\n",
+                   "ANSWER: Request it in the HR portal."],
+        summary="Sick leave is requested in the HR portal.",
+    )
+    ca, ra = build_agents(llm, retrievers, query_embedding=embedding)
+
+    answer = run_multi_agent_conversation("How do I apply for sick leave?", ca, ra)
+
+    assert answer == "Request it in the HR portal."
+    assert any("[Tool Result for retrieval_agent]: Sick leave is requested in the HR portal." in message["content"]
+               for message in ca.log_history)
+    assert {"role": "ra_summary", "content": "Sick leave is requested in the HR portal."} in ra.log_history
+    saved = json.loads(next((tmp_path / "logs").glob("emergent_agent_interaction_*.json")).read_text())
+    assert saved["final_answer"] == answer
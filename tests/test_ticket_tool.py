@@ -0,0 +1,29 @@
+from tools.ticket_tool import TicketLookupTool
+
+
+def _write_csv(tmp_path, text):
+    csv_path = tmp_path / "tickets.csv"
+    csv_path.write_text(text, encoding="utf-8")
+    return str(csv_path)
+
+
+def test_fields_are_returned_as_written(tmp_path):
+    csv_path = _write_csv(tmp_path, "Complaint ID,Employee ID,Amount,Date\nNCX-1,00123,1.50,2024-01-05\n")
+    ticket = TicketLookupTool(csv_path).process_request("NCX-1")
+    assert ticket == {"Employee ID": "00123", "Amount": "1.50", "Date": "2024-01-05"}
+
+
+def test_blank_cell_is_none(tmp_path):
+    csv_path = _write_csv(tmp_path, "Complaint ID,Resolution,Amount\nNCX-1,,\n")
+    ticket = TicketLookupTool(csv_path).process_request("NCX-1")
+    assert ticket == {"Resolution": None, "Amount": None}
+
+
+def test_duplicate_id_keeps_first_row(tmp_path):
+    csv_path = _write_csv(tmp_path, "Complaint ID,Resolution\nNCX-1,first\nNCX-1,second\n")
+    assert TicketLookupTool(csv_path).process_request(" NCX-1 ") == {"Resolution": "first"}
+
+
+def test_unknown_id(tmp_path):
+    csv_path = _write_csv(tmp_path, "Complaint ID,Resolution\nNCX-1,done\n")
+    assert "error" in TicketLookupTool(csv_path).process_request("NCX-9")
@@ -1,4 +1,5 @@
-import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
 from typing import Dict, Any
 
 class TicketLookupTool:
@@ -10,10 +11,18 @@ class TicketLookupTool:
             csv_path (str): The file path to the nexacorp_tickets.csv file.
         """
         try:
-            # Load the CSV file into a pandas DataFrame
-            self.df = pd.read_csv(csv_path, encoding='utf-8')
-            # Set the 'Complaint ID' as the index for faster lookups
-            self.df.set_index('Complaint ID', inplace=True)
+            # Load the CSV file into a pandas DataFrame using PyArrow's multi-threaded parser.
+            # Every column is parsed as a string so fields come back exactly as written (no dates turned
+            # into Timestamps, no "00123" -> "123"); blank cells become None.
+            column_names = pv.open_csv(csv_path).schema.names
+            convert_options = pv.ConvertOptions(column_types={name: pa.string() for name in column_names},
+                                                strings_can_be_null=True)
+            df = pv.read_csv(csv_path, convert_options=convert_options).to_pandas()
+            # Set the 'Complaint ID' as the index, keeping the first row for any repeated ID
+            df.set_index('Complaint ID', inplace=True)
+            df = df[~df.index.duplicated(keep='first')]
+            # Materialize the tickets as a plain dict so lookups don't go through pandas at all
+            self._tickets = {str(ticket_id).strip(): row for ticket_id, row in df.to_dict(orient='index').items()}
         except FileNotFoundError:
             raise FileNotFoundError(f"The ticket data file was not found at {csv_path}")
         except KeyError:
@@ -28,12 +37,11 @@ class TicketLookupTool:
             A dictionary containing the ticket's data or an error message.
         """
         try:
-            # Use .loc for fast index-based lookup
-            ticket_data = self.df.loc[ticket_id.strip()]
-            # Convert the resulting series to a dictionary
-            return ticket_data.to_dict()
-        except KeyError:
-            return {"error": f"Ticket ID '{ticket_id}' not found."}
+            ticket_data = self._tickets.get(ticket_id.strip())
+            if ticket_data is None:
+                return {"error": f"Ticket ID '{ticket_id}' not found."}
+            # Return a copy so callers can't modify the cached ticket
+            return dict(ticket_data)
         except Exception as e:
             return {"error": f"An unexpected error occurred: {e}"}
 
@@ -1,8 +1,21 @@
 # utils/logging_utils.py
 
+import atexit
 import logging
 import csv
 import os
+import threading
+
+import orjson
+
+TRAINING_DATA_FILE = 'data/training_data.csv'
+TRAINING_DATA_FIELDS = ['session_id', 'user_query', 'response', 'log', 'score', 'judgment']
+
+# Long-lived, buffered append handles, opened on first use and closed at exit
+_csv_file = None
+_csv_writer = None
+_jsonl_files = {}
+_lock = threading.Lock()
 
 def get_logger(name):
     logger = logging.getLogger(name)
@@ -15,12 +28,37 @@ def get_logger(name):
         logger.addHandler(ch)
     return logger
 
-def log_interaction(session_id, user_query, response, log, score, judgment):
-    log_file = 'data/training_data.csv'
-    file_exists = os.path.isfile(log_file)
-    with open(log_file, 'a', newline='') as csvfile:
-        fieldnames = ['session_id', 'user_query', 'response', 'log', 'score', 'judgment']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+def _get_csv_writer():
+    global _csv_file, _csv_writer
+    if _csv_writer is None:
+        file_exists = os.path.isfile(TRAINING_DATA_FILE)
+        _csv_file = open(TRAINING_DATA_FILE, 'a', newline='', buffering=1 << 16)
+        _csv_writer = csv.DictWriter(_csv_file, fieldnames=TRAINING_DATA_FIELDS)
         if not file_exists:
-            writer.writeheader()
-        writer.writerow({'session_id': session_id, 'user_query': user_query, 'response': response, 'log': log, 'score': score, 'judgment': judgment})
+            _csv_writer.writeheader()
+    return _csv_writer
+
+def log_interaction(session_id, user_query, response, log, score, judgment):
+    with _lock:
+        _get_csv_writer().writerow({'session_id': session_id, 'user_query': user_query, 'response': response, 'log': log, 'score': score, 'judgment': judgment})
+
+def append_jsonl(path, record):
+    """Appends one record as a compact JSON line to path, keeping the file open between calls."""
+    line = orjson.dumps(record, default=str, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+    with _lock:
+        f = _jsonl_files.get(path)
+        if f is None:
+            f = _jsonl_files[path] = open(path, 'ab', buffering=1 << 16)
+        f.write(line)
+
+@atexit.register
+def close_logs():
+    """Flushes and closes every buffered log file."""
+    global _csv_file, _csv_writer
+    with _lock:
+        for f in _jsonl_files.values():
+            f.close()
+        _jsonl_files.clear()
+        if _csv_file is not None:
+            _csv_file.close()
+            _csv_file = _csv_writer = None
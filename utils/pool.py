@@ -0,0 +1,10 @@
+# utils/pool.py
+
+from concurrent.futures import ThreadPoolExecutor
+
+# Two workers per domain retriever (hr, it, payroll, tickets), so two requests can fan out at once
+MAX_WORKERS = 8
+
+# Shared worker threads for IO-bound fan-out (vector store searches, HTTP calls), reused across requests
+# instead of creating a new pool per query. Tasks submitted here must not block on other tasks in it.
+EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="nexa-worker")
@@ -0,0 +1,36 @@
+# utils/vector_store_registry.py
+
+import os
+from functools import lru_cache
+
+from langchain_chroma import Chroma
+from langchain_huggingface.embeddings import HuggingFaceEmbeddings
+
+DEFAULT_EMBED_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# How many documents each retriever fetches, giving the re-ranker enough candidates to work with
+DEFAULT_FETCH_K = 25
+
+@lru_cache(maxsize=None)
+def get_embeddings(model_name=DEFAULT_EMBED_MODEL):
+    """Loads an embedding model once per process and shares it between all vector stores."""
+    return HuggingFaceEmbeddings(model_name=model_name)
+
+@lru_cache(maxsize=None)
+def get_retriever(persist_directory, embed_model_name=DEFAULT_EMBED_MODEL, k=DEFAULT_FETCH_K):
+    """
+    Opens the vector store at persist_directory once and returns a shared retriever for it.
+    A FAISS index (written by build_vectorstores.py with VECTOR_BACKEND=faiss) is used if
+    present, otherwise the Chroma store. The fetch size is fixed at construction, so callers
+    never need to mutate search_kwargs.
+    """
+    if os.path.exists(os.path.join(persist_directory, "index.faiss")):
+        from langchain_community.vectorstores import FAISS
+
+        # index.pkl is written by our own build script
+        vectorstore = FAISS.load_local(persist_directory, get_embeddings(embed_model_name),
+                                       allow_dangerous_deserialization=True)
+        return vectorstore.as_retriever(search_kwargs={"k": k})
+
+    vectorstore = Chroma(persist_directory=persist_directory, embedding_function=get_embeddings(embed_model_name))
+    return vectorstore.as_retriever(search_kwargs={"k": k})
@@ -1,8 +1,17 @@
 import pandas as pd
+import numpy as np
 import os
-from langchain_community.vectorstores import Chroma
-from langchain_community.document_loaders import UnstructuredWordDocumentLoader, CSVLoader
-from langchain_community.embeddings import HuggingFaceEmbeddings
+import hashlib
+import multiprocessing
+import sqlite3
+import chromadb
+import torch
+from sentence_transformers import SentenceTransformer
+import docx
+from docx.oxml.ns import qn
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+from joblib import Parallel, delayed
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_core.documents import Document
 
@@ -12,7 +21,7 @@ HR_DOC = "data/NexaCorp HR Manual.docx"
 IT_DOC = "data/NexaCorp IT Support Manual.docx"
 PAYROLL_DOC = "data/NexaCorp Payroll Support Manual.docx"
 TICKETS_XLSX = "data/nexacorp_tickets.xlsx"
-TICKETS_CSV = "data/nexacorp_tickets.csv" # Intermediate CSV file
+TICKETS_CSV = "data/nexacorp_tickets.csv" # Exported for TicketLookupTool
 
 # Output directories for ChromaDB
 HR_DIR = "data/chroma/hr"
@@ -20,85 +29,415 @@ IT_DIR = "data/chroma/it"
 PAYROLL_DIR = "data/chroma/payroll"
 TICKETS_DIR = "data/chroma/tickets"
 
+# Every corpus to build: (name, input file, output directory, kind)
+CORPORA = [
+    ("hr", HR_DOC, HR_DIR, "docx"),
+    ("it", IT_DOC, IT_DIR, "docx"),
+    ("payroll", PAYROLL_DOC, PAYROLL_DIR, "docx"),
+    ("tickets", TICKETS_XLSX, TICKETS_DIR, "tickets"),
+]
+
 # Embedding model configuration
 EMBED_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+# Encoder batch size bounds; on GPU the size is picked from free memory (see pick_batch_size)
+CPU_BATCH_SIZE = 8
+MAX_GPU_BATCH_SIZE = 256
 
-def process_word_doc(doc_path: str, persist_dir: str, embeddings):
-    """Loads a .docx file, splits it into chunks, and saves it to a vector store."""
-    print(f"Processing Word document: {doc_path}...")
-    loader = UnstructuredWordDocumentLoader(doc_path)
-    documents = loader.load()
-    
-    text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=150)
-    docs = text_splitter.split_documents(documents)
-    
-    vectorstore = Chroma.from_documents(docs, embeddings, persist_directory=persist_dir)
-    vectorstore.persist()
-    print(f"Successfully saved vector store to {persist_dir}")
+# Optional INT8 ONNX embedder for CPU-only builds (needs `pip install sentence-transformers[onnx]`)
+USE_ONNX_INT8 = os.getenv("USE_ONNX_INT8", "0") == "1"
+ONNX_DIR = "data/onnx_minilm"
+ONNX_INT8_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+# Content-hash cache of chunk embeddings, so unchanged chunks are not re-encoded on the next build
+EMBED_CACHE_DB = "data/embed_cache.db"
+# Keys per SELECT ... IN (...), well under SQLite's bound-parameter limit
+CACHE_LOOKUP_BATCH = 900
+
+# Collection name LangChain's Chroma wrapper opens by default, so the agents can read these stores
+COLLECTION_NAME = "langchain"
+# Rows per collection.add call; keeps each insert well under Chroma's maximum batch size
+CHROMA_BATCH_SIZE = 5000
+
+# Vector store backend: "chroma" (default) or "faiss" (needs `pip install faiss-cpu`). A FAISS build
+# writes index.faiss/index.pkl into each store directory, which the agents' retriever registry prefers.
+VECTOR_BACKEND = os.getenv("VECTOR_BACKEND", "chroma")
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+
+def export_embedder_onnx():
+    """Exports the embedding model to ONNX with dynamically quantized INT8 weights, once."""
+    from sentence_transformers import export_dynamic_quantized_onnx_model
+
+    if not os.path.exists(os.path.join(ONNX_DIR, ONNX_INT8_FILE)):
+        print(f"Exporting {EMBED_MODEL} to INT8 ONNX in {ONNX_DIR}...")
+        onnx_model = SentenceTransformer(EMBED_MODEL, backend="onnx", device="cpu")
+        onnx_model.save_pretrained(ONNX_DIR)
+        export_dynamic_quantized_onnx_model(onnx_model, "avx512_vnni", ONNX_DIR)
+    return ONNX_DIR
+
+def compile_embedder(model: SentenceTransformer):
+    """
+    Wraps the underlying transformer in torch.compile to fuse its many small kernels, and warms it up
+    once so compilation happens before any corpus is processed. Falls back to eager mode on failure.
+    """
+    # Batches have varying sequence lengths, so compile for dynamic shapes instead of one graph per shape
+    model[0].auto_model = torch.compile(model[0].auto_model, dynamic=True)
+    # Warm up under the same inference_mode guard as encode_sorted, at short, medium and maximum
+    # sequence lengths and at more than one batch size, so the real encodes reuse the traced graphs
+    warm_up_texts = [" ".join(["word"] * length) for length in (8, model.max_seq_length // 2, model.max_seq_length)]
+    try:
+        with torch.inference_mode():
+            for text in warm_up_texts:
+                model.encode([text], convert_to_numpy=True, show_progress_bar=False)
+            model.encode(warm_up_texts, convert_to_numpy=True, show_progress_bar=False)
+    except Exception as e:
+        print(f"Warning: torch.compile failed, using the eager model. Error: {e}")
+        restore_eager_embedder(model)
+    return model
+
+def restore_eager_embedder(model: SentenceTransformer):
+    """Swaps a torch.compile'd transformer back to the eager module; returns False if it wasn't compiled."""
+    eager_model = getattr(model[0].auto_model, "_orig_mod", None)
+    if eager_model is None:
+        return False
+    model[0].auto_model = eager_model
+    return True
+
+def load_embedder(use_onnx_int8: bool = False):
+    """
+    Loads the embedding model on the GPU in FP16 when one is available. On the CPU it uses
+    FP32 PyTorch, or the INT8-quantized ONNX export if use_onnx_int8 is set.
+    Returns (model, tag); the tag names the backend, device and precision actually loaded,
+    since each produces slightly different vectors.
+    """
+    if torch.cuda.is_available():
+        # Half precision halves activation memory traffic and runs the matmuls on tensor cores
+        return compile_embedder(SentenceTransformer(EMBED_MODEL, device="cuda").half()), f"{EMBED_MODEL}:torch-cuda-fp16"
+    if use_onnx_int8:
+        return SentenceTransformer(export_embedder_onnx(), backend="onnx", device="cpu",
+                                   model_kwargs={"file_name": ONNX_INT8_FILE}), f"{EMBED_MODEL}:onnx-cpu-int8"
+    return SentenceTransformer(EMBED_MODEL, device="cpu"), f"{EMBED_MODEL}:torch-cpu-fp32"
+
+class EmbeddingCache:
+    """
+    SQLite cache of embeddings keyed by SHA-256 of (model namespace, chunk text).
+    Vectors are stored as FP16, which halves the cache size; normalized MiniLM embeddings
+    lose nothing measurable for retrieval. Older FP32 entries are still read.
+    """
+
+    def __init__(self, path: str, namespace: str):
+        self.namespace = namespace
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS e(h BLOB PRIMARY KEY, v BLOB)")
+
+    def keys_for(self, texts):
+        prefix = f"{self.namespace}\0".encode()
+        return [hashlib.sha256(prefix + text.encode()).digest() for text in texts]
+
+    def lookup(self, keys):
+        """Returns {key: vector bytes} for the keys that are cached."""
+        found = {}
+        for start in range(0, len(keys), CACHE_LOOKUP_BATCH):
+            batch = keys[start:start + CACHE_LOOKUP_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            found.update(self.conn.execute(f"SELECT h, v FROM e WHERE h IN ({placeholders})", batch))
+        return found
+
+    def store(self, keys, vectors):
+        self.conn.executemany("INSERT OR REPLACE INTO e(h, v) VALUES (?, ?)",
+                              zip(keys, (vector.astype(np.float16).tobytes() for vector in vectors)))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+def token_lengths(model: SentenceTransformer, texts):
+    """Token count of each text as the model sees it (capped at its max sequence length)."""
+    tokenizer = getattr(model, "tokenizer", None)
+    if tokenizer is None:
+        return [len(text) for text in texts]
+    encoded = tokenizer(texts, add_special_tokens=False, truncation=True, max_length=model.max_seq_length)
+    return [len(ids) for ids in encoded["input_ids"]]
+
+def bytes_per_sequence(model: SentenceTransformer):
+    """
+    Rough peak activation memory of one sequence at the model's max_seq_length, in the dtype it runs in:
+    the feed-forward intermediate (4 x hidden size) plus one layer's attention scores (heads x length).
+    """
+    config = model[0].auto_model.config
+    seq_length = model.max_seq_length
+    element_size = next(model.parameters()).element_size()
+    return element_size * seq_length * (4 * config.hidden_size + config.num_attention_heads * seq_length)
+
+def pick_batch_size(model: SentenceTransformer):
+    """Largest batch that fits in the GPU's currently free memory (8..256), or a small fixed size on CPU."""
+    if not torch.cuda.is_available() or model.device.type != "cuda":
+        return CPU_BATCH_SIZE
+    free, _ = torch.cuda.mem_get_info(model.device)
+    return min(MAX_GPU_BATCH_SIZE, max(CPU_BATCH_SIZE, free // bytes_per_sequence(model)))
+
+def encode_sorted(model: SentenceTransformer, texts):
+    """
+    Encodes texts in batches of similar token length, so each batch pads as little as possible,
+    and returns the embeddings in the original order.
+    """
+    batch_size = pick_batch_size(model)
+    print(f"Encoding {len(texts)} chunks (batch size {batch_size})...")
+    order = np.argsort(token_lengths(model, texts), kind="stable")
+    sorted_texts = [texts[i] for i in order]
+    embeddings = np.empty((len(texts), model.get_sentence_embedding_dimension()), dtype=np.float32)
+    # encode() would re-sort the whole input by character length, so the batches are cut here
+    # from the token-sorted order and each one is encoded on its own.
+    # inference_mode skips autograd and version-counter bookkeeping for every forward pass.
+    with torch.inference_mode():
+        for start in range(0, len(sorted_texts), batch_size):
+            batch = sorted_texts[start:start + batch_size]
+            try:
+                vectors = model.encode(batch, batch_size=batch_size, convert_to_numpy=True,
+                                       show_progress_bar=False, normalize_embeddings=True)
+            except Exception as e:
+                # A shape the compiled graph can't handle: finish the build with the eager model
+                if not restore_eager_embedder(model):
+                    raise
+                print(f"Warning: compiled model failed, switching to the eager model. Error: {e}")
+                vectors = model.encode(batch, batch_size=batch_size, convert_to_numpy=True,
+                                       show_progress_bar=False, normalize_embeddings=True)
+            embeddings[order[start:start + batch_size]] = vectors
+    return embeddings
+
+def encode_cached(model: SentenceTransformer, texts, cache: EmbeddingCache = None):
+    """
+    Returns the embeddings of texts, reusing cached vectors and only encoding the misses.
+    Every vector is rounded to FP16 precision (the precision the cache stores), so a build from
+    a warm cache writes exactly the same vectors as a cold one.
+    """
+    if cache is None:
+        embeddings = encode_sorted(model, texts)
+        embeddings[:] = embeddings.astype(np.float16)
+        return embeddings
+
+    keys = cache.keys_for(texts)
+    cached = cache.lookup(keys)
+    dim = model.get_sentence_embedding_dimension()
+    embeddings = np.empty((len(texts), dim), dtype=np.float32)
+    missing = []
+    for i, key in enumerate(keys):
+        if key in cached:
+            blob = cached[key]
+            # Older FP32 entries are rounded like everything else
+            embeddings[i] = np.frombuffer(blob, dtype=np.float16 if len(blob) == 2 * dim else np.float32).astype(np.float16)
+        else:
+            missing.append(i)
+
+    print(f"Embedding cache: {len(texts) - len(missing)} hits, {len(missing)} to encode.")
+    if missing:
+        new_embeddings = encode_sorted(model, [texts[i] for i in missing]).astype(np.float16)
+        embeddings[missing] = new_embeddings
+        cache.store([keys[i] for i in missing], new_embeddings)
+    return embeddings
+
+def encode_texts(model: SentenceTransformer, texts, cache: EmbeddingCache = None):
+    """
+    Returns the embeddings of texts as one contiguous (N, dim) float32 matrix in C order;
+    every batch taken from it later is a view, not a copy.
+    Identical texts (e.g. canned ticket resolutions) are embedded once and the vector is shared.
+    """
+    position = {}
+    unique_texts = []
+    inverse = np.empty(len(texts), dtype=np.intp)
+    for i, text in enumerate(texts):
+        j = position.setdefault(text, len(unique_texts))
+        if j == len(unique_texts):
+            unique_texts.append(text)
+        inverse[i] = j
+
+    embeddings = encode_cached(model, unique_texts, cache)
+    if len(unique_texts) == len(texts):
+        return embeddings
+    print(f"Skipped {len(texts) - len(unique_texts)} duplicate chunks.")
+    return embeddings[inverse]
+
+def persist_faiss(docs, embeddings, persist_dir: str):
+    """Writes the documents and their vectors as a FAISS HNSW index in LangChain's FAISS save format."""
+    import faiss
+    from langchain_community.docstore.in_memory import InMemoryDocstore
+    from langchain_community.vectorstores import FAISS
+
+    # Vectors are stored as FP16 (half the bytes on disk and in RAM); the HNSW graph is unchanged
+    index = faiss.IndexHNSWSQ(embeddings.shape[1], faiss.ScalarQuantizer.QT_fp16, HNSW_M)
+    index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+    # The embedding matrix is already contiguous float32, so FAISS reads the buffer without copying
+    if not index.is_trained:
+        index.train(embeddings)
+    index.add(embeddings)
+
+    ids = [str(i) for i in range(len(docs))]
+    # The query embedding function is supplied when the agents load the index
+    vectorstore = FAISS(
+        embedding_function=None,
+        index=index,
+        docstore=InMemoryDocstore(dict(zip(ids, docs))),
+        index_to_docstore_id=dict(enumerate(ids)),
+    )
+    vectorstore.save_local(persist_dir)
     return vectorstore
 
-def process_tickets_csv(csv_path: str, persist_dir: str, embeddings):
+def persist_documents(docs, persist_dir: str, model: SentenceTransformer, cache: EmbeddingCache = None):
+    """Embeds the documents and writes them, with their vectors, to a fresh vector store."""
+    texts = [doc.page_content for doc in docs]
+    embeddings = encode_texts(model, texts, cache)
+
+    if VECTOR_BACKEND == "faiss":
+        return persist_faiss(docs, embeddings, persist_dir)
+
+    # Drop a FAISS index left by an earlier build, since the agents would prefer it over Chroma
+    for stale_file in ("index.faiss", "index.pkl"):
+        if os.path.exists(os.path.join(persist_dir, stale_file)):
+            os.remove(os.path.join(persist_dir, stale_file))
+
+    client = chromadb.PersistentClient(path=persist_dir)
+    # Rebuild from scratch so re-running the script doesn't duplicate documents
+    try:
+        client.delete_collection(COLLECTION_NAME)
+    except Exception:
+        pass  # Nothing to delete on the first build
+    collection = client.create_collection(COLLECTION_NAME)
+    ids = [str(i) for i in range(len(docs))]
+    metadatas = [doc.metadata or None for doc in docs]
+    for start in range(0, len(docs), CHROMA_BATCH_SIZE):
+        end = start + CHROMA_BATCH_SIZE
+        # Chroma's API takes lists, so only the current slice is converted
+        collection.add(
+            ids=ids[start:end],
+            embeddings=embeddings[start:end].tolist(),
+            documents=texts[start:end],
+            metadatas=metadatas[start:end],
+        )
+    return collection
+
+def load_docx_fast(doc_path: str):
     """
-    Loads ticket data from a CSV, structures it for semantic search,
-    and saves it to a vector store.
+    Reads the text of a .docx file with python-docx: every non-empty paragraph and table row, in document
+    order so tables stay under their section headings. The manuals are plain text and tables, so this
+    skips Unstructured's partitioning pipeline.
     """
-    print(f"Processing tickets CSV file: {csv_path}...")
-    df = pd.read_csv(csv_path, encoding='utf-8')
+    document = docx.Document(doc_path)
+    lines = []
+    for element in document.element.body.iterchildren():
+        if element.tag == qn("w:p"):
+            text = Paragraph(element, document).text
+            if text.strip():
+                lines.append(text)
+        elif element.tag == qn("w:tbl"):
+            for row in Table(element, document).rows:
+                cells = [cell.text.strip() for cell in row.cells if cell.text.strip()]
+                if cells:
+                    lines.append(" | ".join(cells))
+    return [Document(page_content="\n".join(lines), metadata={"source": doc_path})]
+
+def load_and_split(doc_path: str, chunk_size: int = 1000, chunk_overlap: int = 150):
+    """Loads a .docx file and splits it into chunks. Runs in a worker process, so it only touches its arguments."""
+    print(f"Processing Word document: {doc_path}...")
+    documents = load_docx_fast(doc_path)
+    
+    text_splitter = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    return text_splitter.split_documents(documents)
+
+def embed_and_persist(docs, persist_dir: str, model: SentenceTransformer, cache: EmbeddingCache = None):
+    """Embeds already split chunks and saves them to a vector store."""
+    collection = persist_documents(docs, persist_dir, model, cache)
+    print(f"Successfully saved vector store to {persist_dir}")
+    return collection
+
+def split_tickets(df: pd.DataFrame):
+    """Structures already loaded ticket data for semantic search and splits it into chunks."""
+    print(f"Processing {len(df)} tickets...")
 
-    # Create a new column with structured text for better semantic meaning
-    df['structured_text'] = df.apply(
-        lambda row: f"Ticket ID: {row['Complaint ID']}. User Complaint: {row['Complaint']}. Final Resolution: {row['Resolution']}",
-        axis=1
+    # Create a new column with structured text for better semantic meaning (vectorized, no per-row Python).
+    # Missing cells are filled with 'nan' first, as the old per-row f-string rendered them; on pandas 3
+    # astype(str) keeps them missing and the concatenation would turn the whole text into NaN.
+    def as_text(column):
+        return df[column].fillna("nan").astype(str)
+
+    df['structured_text'] = (
+        "Ticket ID: " + as_text('Complaint ID')
+        + ". User Complaint: " + as_text('Complaint')
+        + ". Final Resolution: " + as_text('Resolution')
     )
 
-    # Create LangChain Document objects from the structured text
-    documents = [
-        Document(
-            page_content=row['structured_text'],
-            metadata={
-                "ticket_id": row['Complaint ID'],
-                "employee": row['Employee Name'],
-                "domain": row['Domain'],
-                "status": row['Status']
-            }
-        ) for index, row in df.iterrows()
+    # Metadata for each ticket, in row order, zipped straight from the column values. tolist() yields
+    # plain Python scalars (to_numpy() would give numpy ints, which Chroma rejects as metadata)
+    metadatas = [
+        {
+            "ticket_id": ticket_id,
+            "employee": employee,
+            "domain": domain,
+            "status": status
+        } for ticket_id, employee, domain, status in zip(
+            df['Complaint ID'].tolist(), df['Employee Name'].tolist(), df['Domain'].tolist(), df['Status'].tolist()
+        )
     ]
 
+    # Split the tickets across worker processes (the splitter is pure Python and holds the GIL),
+    # then wrap every chunk in a LangChain Document carrying its ticket's metadata
     text_splitter = RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=50)
-    docs = text_splitter.split_documents(documents)
-
-    vectorstore = Chroma.from_documents(docs, embeddings, persist_directory=persist_dir)
-    vectorstore.persist()
-    print(f"Successfully saved structured ticket vector store to {persist_dir}")
-    return vectorstore
+    splits = Parallel(n_jobs=-1, backend="loky", batch_size=256)(
+        delayed(text_splitter.split_text)(text) for text in df['structured_text'].tolist()
+    )
+    docs = [
+        Document(page_content=chunk, metadata=dict(metadatas[i]))
+        for i, chunks in enumerate(splits) for chunk in chunks
+    ]
+    return docs
 
-def convert_excel_to_csv(xlsx_path: str, csv_path: str):
-    """Converts an Excel file to a CSV file."""
-    print(f"Converting {xlsx_path} to {csv_path}...")
-    df = pd.read_excel(xlsx_path)
+def load_tickets(xlsx_path: str, csv_path: str) -> pd.DataFrame:
+    """
+    Reads the ticket spreadsheet once with the Rust-based calamine engine and returns it.
+    The CSV copy is still written because TicketLookupTool loads tickets from it.
+    """
+    print(f"Loading tickets from {xlsx_path}...")
+    df = pd.read_excel(xlsx_path, engine='calamine')
     df.to_csv(csv_path, index=False, encoding='utf-8')
-    print("Conversion successful.")
+    print(f"Exported tickets to {csv_path}.")
+    return df
+
+def build_all(use_onnx_int8: bool = USE_ONNX_INT8):
+    """
+    Builds every corpus in CORPORA: all documents are loaded and split first, then one
+    embedding model and one embedding cache are shared by every corpus's encode-and-save pass.
+    """
+    word_docs = [(name, path) for name, path, _, kind in CORPORA if kind == "docx"]
+
+    # Load and split the Word documents in parallel; parsing is CPU-bound and independent per file.
+    # This runs before the model is loaded so the worker processes never inherit a CUDA context.
+    workers = max(1, min(len(word_docs), (os.cpu_count() or 2) - 1))
+    with multiprocessing.Pool(workers) as pool:
+        split_docs = pool.starmap(load_and_split, [(doc_path, 1000, 150) for _, doc_path in word_docs])
+    docs_by_corpus = {name: docs for (name, _), docs in zip(word_docs, split_docs)}
 
-def main():
-    """Main function to build all vector stores."""
-    # Initialize the embeddings model once
-    embeddings = HuggingFaceEmbeddings(model_name=EMBED_MODEL)
-
-    # Create directories if they don't exist
-    os.makedirs(HR_DIR, exist_ok=True)
-    os.makedirs(IT_DIR, exist_ok=True)
-    os.makedirs(PAYROLL_DIR, exist_ok=True)
-    os.makedirs(TICKETS_DIR, exist_ok=True)
-
-    # Process all document files
-    process_word_doc(HR_DOC, HR_DIR, embeddings)
-    process_word_doc(IT_DOC, IT_DIR, embeddings)
-    process_word_doc(PAYROLL_DOC, PAYROLL_DIR, embeddings)
-    
     # Process the tickets file
-    convert_excel_to_csv(TICKETS_XLSX, TICKETS_CSV)
-    process_tickets_csv(TICKETS_CSV, TICKETS_DIR, embeddings)
+    for name, path, _, kind in CORPORA:
+        if kind == "tickets":
+            docs_by_corpus[name] = split_tickets(load_tickets(path, TICKETS_CSV))
 
+    # Initialize the embeddings model once
+    model, embedder_tag = load_embedder(use_onnx_int8)
+    # Each backend/device/precision gives slightly different vectors, so each is cached separately
+    cache = EmbeddingCache(EMBED_CACHE_DB, embedder_tag)
+
+    # Embed and save every corpus on the main process, which owns the (single) GPU
+    for name, _, persist_dir, _ in CORPORA:
+        # Create directories if they don't exist
+        os.makedirs(persist_dir, exist_ok=True)
+        embed_and_persist(docs_by_corpus[name], persist_dir, model, cache)
+        # Hand cached activation blocks back to the driver so the next corpus starts unfragmented
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    cache.close()
+
+def main(use_onnx_int8: bool = USE_ONNX_INT8):
+    """Main function to build all vector stores."""
+    build_all(use_onnx_int8)
     print("\nAll vector stores have been built successfully.")
 
 if __name__ == "__main__":